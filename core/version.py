@@ -1,18 +1,34 @@
+from __future__ import annotations
+
 from importlib import resources
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from importlib.resources.abc import Traversable
+
+__all__ = ["VERSION_FILE_PATH", "__version__"]
 
-__all__ = ["__version__"]
+
+def _resolve_version_file() -> Traversable | None:
+    """Resolve the packaged version file, or None if resources are unavailable."""
+    try:
+        return resources.files("core").joinpath("version_info.txt")  # type: ignore[attr-defined]
+    except Exception:  # noqa: BLE001 broad fallback is intentional
+        return None
+
+
+VERSION_FILE_PATH = _resolve_version_file()
 
 
 def _load_version() -> str:
     """Load version string from the version file.
 
-    Returns "0.0.0" if any exception occurs (safe fallback).
+    Returns "0.0.0" if the file could not be resolved or read (safe fallback).
     """
+    if VERSION_FILE_PATH is None:
+        return "0.0.0"
     try:
-        res_root = resources.files("core")  # type: ignore[attr-defined]
-        version_path = res_root.joinpath("version_info.txt")
-        with version_path.open(encoding="utf-8") as fh:
-            return fh.read().strip()
+        return VERSION_FILE_PATH.read_bytes().strip().decode("ascii")
     except Exception:  # noqa: BLE001 broad fallback is intentional
         return "0.0.0"
 
@@ -1,34 +1,45 @@
 #!/usr/bin/env python3
 """Create a git tag from the first version section in CHANGELOG.md."""
 
+import functools
 import re
 import subprocess
 import sys
 from pathlib import Path
 
+_RE_VERSION = re.compile(r"##\s*\[(\d+\.\d+\.\d+)\]")
+
 
 def get_latest_version_from_changelog(changelog_path: Path) -> str:
     """Return the first found version header (## [X.Y.Z])."""
     if not changelog_path.exists():
         raise FileNotFoundError(f"Changelog file not found: {changelog_path}")
     with open(changelog_path, encoding="utf-8") as fh:
-        content = fh.read()
-    version_pattern = r"##\s*\[(\d+\.\d+\.\d+)\]"
-    matches = re.findall(version_pattern, content)
-    if not matches:
-        raise ValueError("No version found in changelog")
-    return matches[0]
+        for line in fh:
+            match = _RE_VERSION.search(line)
+            if match:
+                return match.group(1)
+    raise ValueError("No version found in changelog")
 
 
-def check_if_tag_exists(tag: str) -> bool:
-    """Return True if the tag already exists."""
+@functools.lru_cache(maxsize=1)
+def _all_tags() -> frozenset[str]:
+    """Return all local tag names, listed once with a single git call."""
     try:
         result = subprocess.run(
-            ["git", "tag", "-l", tag], capture_output=True, text=True, check=True
+            ["git", "for-each-ref", "--format=%(refname:lstrip=2)", "refs/tags"],
+            capture_output=True,
+            text=True,
+            check=True,
         )
-        return bool(result.stdout.strip())
+        return frozenset(result.stdout.splitlines())
     except subprocess.CalledProcessError:
-        return False
+        return frozenset()
+
+
+def check_if_tag_exists(tag: str) -> bool:
+    """Return True if the tag already exists."""
+    return tag in _all_tags()
 
 
 def create_git_tag(version: str, message: str | None = None) -> bool:
@@ -41,6 +52,7 @@ def create_git_tag(version: str, message: str | None = None) -> bool:
         return True
     try:
         subprocess.run(["git", "tag", "-a", tag_name, "-m", message], check=True)
+        _all_tags.cache_clear()
         print(f"Created tag: {tag_name}")
         subprocess.run(["git", "push", "origin", tag_name], check=True)
         print(f"Pushed tag: {tag_name}")
@@ -24,19 +24,17 @@ def read_current_version() -> str:
 
 
 def extract_latest_release() -> str | None:
-    text = CHANGELOG.read_text(encoding="utf-8")
-    for match in RE_RELEASE.finditer(text):
-        ver = match.group("ver")
-        if ver.lower() != "unreleased":  # guard
-            return ver
+    with CHANGELOG.open(encoding="utf-8") as fh:
+        for line in fh:
+            match = RE_RELEASE.match(line)
+            if match:
+                return match.group("ver")
     return None
 
 
 def update_version_files(new_version: str) -> None:
     VERSION_FILE.write_text(f"{new_version}\n", encoding="utf-8")
-    # pyproject stays dynamic; inert rewrite kept for potential future sync.
-    py = PYPROJECT.read_text(encoding="utf-8")
-    PYPROJECT.write_text(py, encoding="utf-8")
+    # pyproject reads its version dynamically from VERSION_FILE; nothing to sync.
 
 
 def main() -> int:
@@ -10,12 +10,14 @@ Enhancements:
     docType, docSubtitle, docVersion, docAuthor, and createdDate derived from release metadata.
 """
 
-import json
+import ast
+import functools
+import io
 import os
 import re
 import subprocess
 import sys
-from datetime import datetime
+from collections import Counter, defaultdict
 from pathlib import Path
 
 ROOT_DIR = Path(__file__).parent.parent
@@ -24,6 +26,22 @@ OUTPUT_PATH = ROOT_DIR / "resources" / "docs" / "srvp_TR.md"
 REPORT_PATH = ROOT_DIR / "resources" / "docs" / "report.json"
 TESTS_DIR = ROOT_DIR / "tests"
 SRS_PATH = ROOT_DIR / "resources" / "docs" / "srs.md"
+VERSION_FILE = ROOT_DIR / "core" / "version_info.txt"
+REQMAP_CACHE_PATH = ROOT_DIR / ".cache" / "srvp_reqmap.json"
+# Bump when the scanner's output changes so stale cache entries are ignored
+REQMAP_CACHE_VERSION = 1
+# Minimum number of changed test files before scanning in worker processes. Even
+# then the pool is only used with the "fork" start method; under "spawn" (Windows,
+# macOS) worker start-up outweighs the parsing saved for realistic suite sizes.
+PARALLEL_SCAN_MIN_FILES = 16
+
+# Requirement IDs like REQ-FUNC-LOG-010, REQ-NFR-REL-001, etc.
+_RE_REQ_ID = re.compile(r"REQ-(?:[A-Z]+-)+\d{3}")
+_RE_DOC_AUTHOR = re.compile(r"^docAuthor:\s*(.+)$", re.MULTILINE)
+
+# Report lookups: test outcome -> badge, requirement status -> summary category
+_BADGE = {"passed": "✅", "failed": "❌", "skipped": "➖"}
+_CATEGORY = {"[x] Verified": "verified", "[x] Failed": "failed"}
 
 
 def check_pytest_available():
@@ -77,33 +95,58 @@ def parse_test_report():
     if not REPORT_PATH.exists():
         raise FileNotFoundError(f"Test report not found at {REPORT_PATH}")
 
-    with open(REPORT_PATH, encoding="utf-8") as f:
-        report = json.load(f)
+    import json
 
     test_outcomes = {}
-    for test in report.get("tests", []):
-        test_outcomes[test["nodeid"]] = test["outcome"]
+    try:
+        import ijson  # optional: stream tests instead of loading the whole report
+    except ImportError:
+        ijson = None
+
+    if ijson is not None:
+        with open(REPORT_PATH, "rb") as f:
+            for test in ijson.items(f, "tests.item"):
+                test_outcomes[test["nodeid"]] = test["outcome"]
+    else:
+        with open(REPORT_PATH, encoding="utf-8") as f:
+            report = json.load(f)
+        for test in report.get("tests", []):
+            test_outcomes[test["nodeid"]] = test["outcome"]
 
     print(f"Found {len(test_outcomes)} test results")
     return test_outcomes
 
 
-def extract_requirement_ids_from_docs() -> set[str]:
-    """Extract all requirement IDs appearing in SRVP/SRS documents.
-
-    Matches patterns like REQ-FUNC-LOG-010, REQ-NFR-REL-001, etc.
-    """
+@functools.lru_cache(maxsize=4)
+def _extract_req_ids_cached(docs: tuple[tuple[Path, int], ...]) -> frozenset[str]:
+    """Scan the given documents; ``docs`` pairs each path with its mtime for invalidation."""
     ids: set[str] = set()
-    pattern = re.compile(r"REQ-(?:[A-Z]+-)+\d{3}")
-    for path in (SRVP_PATH, SRS_PATH):
+    for path, _mtime_ns in docs:
         try:
             if path.exists():
                 text = path.read_text(encoding="utf-8")
-                ids.update(pattern.findall(text))
+                ids.update(_RE_REQ_ID.findall(text))
         except Exception:
             # Ignore read errors; best-effort extraction
             pass
-    return ids
+    return frozenset(ids)
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def extract_requirement_ids_from_docs() -> set[str]:
+    """Extract all requirement IDs appearing in SRVP/SRS documents.
+
+    Matches patterns like REQ-FUNC-LOG-010, REQ-NFR-REL-001, etc.
+    Results are memoized per process until either document's mtime changes.
+    """
+    docs = tuple((path, _mtime_ns(path)) for path in (SRVP_PATH, SRS_PATH))
+    return set(_extract_req_ids_cached(docs))
 
 
 def _read_doc_author_from_srvp() -> str | None:
@@ -111,7 +154,7 @@ def _read_doc_author_from_srvp() -> str | None:
     try:
         if SRVP_PATH.exists():
             txt = SRVP_PATH.read_text(encoding="utf-8")
-            m = re.search(r"^docAuthor:\s*(.+)$", txt, flags=re.MULTILINE)
+            m = _RE_DOC_AUTHOR.search(txt)
             if m:
                 return m.group(1).strip()
     except Exception:
@@ -127,19 +170,33 @@ def _git_cmd_output(args: list[str]) -> str | None:
         return None
 
 
+@functools.lru_cache(maxsize=1)
+def _git_last_commit() -> tuple[str | None, str | None]:
+    """Return (author date ISO 8601, author name) of HEAD using a single git call."""
+    out = _git_cmd_output(["log", "-1", "--format=%aI%n%an"])
+    if not out:
+        return None, None
+    iso, _, name = out.partition("\n")
+    return iso.strip() or None, name.strip() or None
+
+
+@functools.lru_cache(maxsize=1)
 def _get_release_metadata() -> tuple[str, str, str]:
     """Return (version, author, date) for the report front matter.
 
         Strategy:
-        - version: core.version.__version__ (from version_info.txt), fallback "0.0.0"
+        - version: core/version_info.txt (read directly, without importing core),
+            fallback "0.0.0"
         - author: env RELEASE_AUTHOR or GITHUB_ACTOR, then SRVP docAuthor,
-            then git user.name, else "Unknown"
+            then latest commit author name, else "Unknown"
         - date: env RELEASE_DATE (YYYY-MM-DD), then latest commit author-date,
             else today in YYYY-MM-DD
     """
+    from datetime import datetime
+
     # Version
     try:
-        from core.version import __version__ as ver
+        ver = VERSION_FILE.read_text(encoding="utf-8").strip() or "0.0.0"
     except Exception:
         ver = "0.0.0"
 
@@ -148,7 +205,7 @@ def _get_release_metadata() -> tuple[str, str, str]:
         os.environ.get("RELEASE_AUTHOR")
         or os.environ.get("GITHUB_ACTOR")
         or _read_doc_author_from_srvp()
-        or _git_cmd_output(["config", "user.name"])  # local git user
+        or _git_last_commit()[1]  # latest commit author
         or "Unknown"
     )
 
@@ -156,7 +213,7 @@ def _get_release_metadata() -> tuple[str, str, str]:
     date = os.environ.get("RELEASE_DATE")
     if not date:
         # Try latest commit author date (ISO 8601); convert to YYYY-MM-DD
-        iso = _git_cmd_output(["log", "-1", "--format=%aI"])  # e.g., 2025-09-16T09:58:12+00:00
+        iso = _git_last_commit()[0]  # e.g., 2025-09-16T09:58:12+00:00
         if iso:
             try:
                 date = datetime.fromisoformat(iso.replace("Z", "+00:00")).date().isoformat()
@@ -168,51 +225,185 @@ def _get_release_metadata() -> tuple[str, str, str]:
     return ver, author, date
 
 
+def _iter_test_functions(tree: ast.Module):
+    """Yield (pytest name, node) for module-level and class-level test functions."""
+    func_types = (ast.FunctionDef, ast.AsyncFunctionDef)
+    for node in tree.body:
+        if isinstance(node, func_types) and node.name.startswith("test_"):
+            yield node.name, node
+        elif isinstance(node, ast.ClassDef):
+            for item in node.body:
+                if isinstance(item, func_types) and item.name.startswith("test_"):
+                    yield f"{node.name}::{item.name}", item
+
+
+def _scan_test_file(test_file: Path) -> tuple[dict[str, list[str]] | None, list[str]]:
+    """Return the requirement -> test nodeids mapping of a single test file.
+
+    The mapping is None if the file cannot be parsed. Progress messages are
+    returned rather than printed so the caller can emit them in file order
+    when files are scanned in worker processes.
+    """
+    log: list[str] = []
+    content = test_file.read_text(encoding="utf-8")
+    try:
+        tree = ast.parse(content, filename=str(test_file))
+    except SyntaxError as e:
+        log.append(f"    WARNING: skipping {test_file.name}: {e}")
+        return None, log
+
+    file_reqs: defaultdict[str, list[str]] = defaultdict(list)
+    for test_name, node in _iter_test_functions(tree):
+        docstring = ast.get_docstring(node) or ""
+        # Full nodeid format to match pytest output
+        full_test_name = f"tests/{test_file.name}::{test_name}"
+
+        # Find requirement IDs in the docstring (support FUNC, NFR, etc.)
+        req_ids = _RE_REQ_ID.findall(docstring)
+        for req_id in req_ids:
+            file_reqs[req_id].append(full_test_name)
+            log.append(f"    {req_id} -> {test_name}")
+    return dict(file_reqs), log
+
+
+def _is_valid_cache_entry(entry: object) -> bool:
+    """Return True if ``entry`` has the shape written by extract_req_ids_from_docstrings."""
+    if not isinstance(entry, dict):
+        return False
+    reqs = entry.get("reqs")
+    return (
+        isinstance(entry.get("mtime_ns"), int)
+        and isinstance(entry.get("size"), int)
+        and isinstance(reqs, dict)
+        and all(isinstance(tests, list) for tests in reqs.values())
+    )
+
+
+def _load_reqmap_cache() -> dict:
+    """Load the per-file requirement mapping cache (empty if disabled/unreadable).
+
+    Entries from another schema version or with an unexpected shape are dropped.
+    """
+    if os.environ.get("SRVP_NO_CACHE"):
+        return {}
+    import json
+
+    try:
+        data = json.loads(REQMAP_CACHE_PATH.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    if not isinstance(data, dict) or data.get("version") != REQMAP_CACHE_VERSION:
+        return {}
+    files = data.get("files")
+    if not isinstance(files, dict):
+        return {}
+    return {key: entry for key, entry in files.items() if _is_valid_cache_entry(entry)}
+
+
+def _save_reqmap_cache(cache: dict) -> None:
+    """Best-effort write of the per-file requirement mapping cache."""
+    if os.environ.get("SRVP_NO_CACHE"):
+        return
+    import json
+
+    data = {"version": REQMAP_CACHE_VERSION, "files": cache}
+    try:
+        REQMAP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        REQMAP_CACHE_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    except Exception as e:
+        print(f"  WARNING: could not write cache {REQMAP_CACHE_PATH}: {e}")
+
+
+def _scan_jobs() -> int:
+    """Number of worker processes for scanning test files (env SRVP_JOBS, default CPU count)."""
+    try:
+        return max(1, int(os.environ.get("SRVP_JOBS") or os.cpu_count() or 1))
+    except ValueError:
+        return 1
+
+
+def _fork_start_method() -> bool:
+    """Return True if worker processes would be started with "fork"."""
+    import multiprocessing
+
+    return multiprocessing.get_start_method() == "fork"
+
+
 def extract_req_ids_from_docstrings():
-    """Extract requirement IDs from test function docstrings."""
-    print("Extracting requirement IDs from test files...")
-    req_to_tests = {}
-
-    for test_file in TESTS_DIR.glob("test_*.py"):
-        print(f"  Processing {test_file.name}...")
-        content = test_file.read_text(encoding="utf-8")
-
-        # IMPROVED REGEX: More flexible whitespace handling
-        # Allows for any amount of whitespace and newlines between function def and docstring
-        pattern = r'def (test_\w+)\([^)]*\):[\s\S]*?"""([\s\S]*?)"""'
-
-        for match in re.finditer(pattern, content):
-            test_name = match.group(1)
-            docstring = match.group(2)
-            # Full nodeid format to match pytest output
-            full_test_name = f"tests/{test_file.name}::{test_name}"
-
-            # Find requirement IDs in the docstring (support FUNC, NFR, etc.)
-            req_ids = re.findall(r"REQ-(?:[A-Z]+-)+\d{3}", docstring)
-            for req_id in req_ids:
-                if req_id not in req_to_tests:
-                    req_to_tests[req_id] = []
-                req_to_tests[req_id].append(full_test_name)
-                print(f"    {req_id} -> {test_name}")
+    """Extract requirement IDs from test function docstrings.
 
+    Per-file results are cached in REQMAP_CACHE_PATH keyed by (mtime, size), so
+    unchanged test files are not parsed again. Set SRVP_NO_CACHE=1 to disable.
+    When at least PARALLEL_SCAN_MIN_FILES files changed and workers are forked,
+    they are parsed in worker processes; set SRVP_JOBS=1 to always scan serially.
+    """
+    print("Extracting requirement IDs from test files...")
+    req_to_tests: defaultdict[str, list[str]] = defaultdict(list)
+    cache = _load_reqmap_cache()
+    new_cache = {}
+
+    test_files = sorted(TESTS_DIR.glob("test_*.py"))
+    stats = {test_file: test_file.stat() for test_file in test_files}
+    cached: dict[Path, dict[str, list[str]]] = {}
+    to_scan = []
+    for test_file in test_files:
+        st = stats[test_file]
+        entry = cache.get(str(test_file))
+        if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            cached[test_file] = entry["reqs"]
+        else:
+            to_scan.append(test_file)
+
+    results: dict[Path, tuple[dict[str, list[str]] | None, list[str]]] = {}
+    jobs = min(_scan_jobs(), len(to_scan))
+    if jobs > 1 and len(to_scan) >= PARALLEL_SCAN_MIN_FILES and _fork_start_method():
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs) as ex:
+            results.update(zip(to_scan, ex.map(_scan_test_file, to_scan), strict=True))
+    else:
+        results.update((test_file, _scan_test_file(test_file)) for test_file in to_scan)
+
+    for test_file in test_files:
+        if test_file in cached:
+            print(f"  Processing {test_file.name} (cached)...")
+            file_reqs = cached[test_file]
+        else:
+            print(f"  Processing {test_file.name}...")
+            file_reqs, log = results[test_file]
+            for line in log:
+                print(line)
+            if file_reqs is None:
+                continue
+        st = stats[test_file]
+        new_cache[str(test_file)] = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "reqs": file_reqs,
+        }
+        for req_id, tests in file_reqs.items():
+            req_to_tests[req_id].extend(tests)
+
+    _save_reqmap_cache(new_cache)
     print(f"Found {len(req_to_tests)} requirements with associated tests")
-    return req_to_tests
+    return dict(req_to_tests)
 
 
 def get_requirement_statuses(test_outcomes, req_to_tests):
     """Determine the status of each requirement based on test outcomes."""
     print("Determining requirement statuses...")
     req_statuses = {}
+    get_outcome = test_outcomes.get  # bound once for the loop below
 
     for req_id, test_names in req_to_tests.items():
-        outcomes = [test_outcomes.get(name, "skipped") for name in test_names]
+        outcomes = [get_outcome(name, "skipped") for name in test_names]
         print(f"  {req_id}: tests={test_names}, outcomes={outcomes}")
 
         # A requirement is 'Failed' if any of its tests fail.
         if "failed" in outcomes:
             req_statuses[req_id] = "[x] Failed"
         # It is 'Verified' only if all of its tests pass.
-        elif outcomes and all(o == "passed" for o in outcomes):
+        elif outcomes and not any(o != "passed" for o in outcomes):
             req_statuses[req_id] = "[x] Verified"
         # Otherwise, the status is not determined
         else:
@@ -229,58 +420,52 @@ def build_markdown_report(
 ) -> str:
     """Create a standalone Markdown report summarizing test results vs requirements."""
     total_tests = len(test_outcomes)
-    passed = sum(1 for o in test_outcomes.values() if o == "passed")
-    failed = sum(1 for o in test_outcomes.values() if o == "failed")
-    skipped = sum(1 for o in test_outcomes.values() if o == "skipped")
+    outcome_counts = Counter(test_outcomes.values())
+    passed = outcome_counts["passed"]
+    failed = outcome_counts["failed"]
+    skipped = outcome_counts["skipped"]
 
     # Aggregate requirement IDs from docs and tests
     ids_from_docs = extract_requirement_ids_from_docs()
     all_req_ids_sorted = sorted(set(req_to_tests.keys()) | ids_from_docs)
 
-    # Compute counts across all requirements (default Not Started)
-    def status_of(req_id: str) -> str:
-        return req_statuses.get(req_id, "[ ] Not Started")
-
+    # Compute counts across all requirements (anything not verified/failed is pending)
     total_reqs = len(all_req_ids_sorted)
-    verified = sum(1 for rid in all_req_ids_sorted if status_of(rid).endswith("Verified"))
-    req_failed = sum(1 for rid in all_req_ids_sorted if status_of(rid).endswith("Failed"))
-    pending = total_reqs - verified - req_failed
+    req_counts = Counter(
+        _CATEGORY.get(req_statuses.get(rid, ""), "pending") for rid in all_req_ids_sorted
+    )
+    verified = req_counts["verified"]
+    req_failed = req_counts["failed"]
+    pending = req_counts["pending"]
 
     # Front matter with release metadata
     version, author, date = _get_release_metadata()
 
-    lines: list[str] = []
-    lines.append("---")
-    lines.append("docType: Software Requirements Verification Plan Report (SRVPR)")
-    lines.append("docSubtitle: CAN Frame Retransmission Tool")
-    lines.append(f"docVersion: {version}")
-    lines.append(f"docAuthor: {author}")
-    lines.append(f"createdDate: {date}")
-    lines.append("---")
-    lines.append("")
-    lines.append("# Test Report - SRVP Functional Requirements")
-    lines.append("")
-    lines.append(
+    buf = io.StringIO()
+    buf.write(
+        "---\n"
+        "docType: Software Requirements Verification Plan Report (SRVPR)\n"
+        "docSubtitle: CAN Frame Retransmission Tool\n"
+        f"docVersion: {version}\n"
+        f"docAuthor: {author}\n"
+        f"createdDate: {date}\n"
+        "---\n"
+        "\n"
+        "# Test Report - SRVP Functional Requirements\n"
+        "\n"
         "This document summarizes the latest test run and the verification status "
-        "of the SRVP functional requirements."
-    )
-    lines.append("")
-    lines.append("## Summary")
-    lines.append("")
-    lines.append(
-        f"- Tests: {passed} passed, {failed} failed, {skipped} skipped (total {total_tests})"
-    )
-    lines.append(
+        "of the SRVP functional requirements.\n"
+        "\n"
+        "## Summary\n"
+        "\n"
+        f"- Tests: {passed} passed, {failed} failed, {skipped} skipped (total {total_tests})\n"
         f"- Requirements: {verified} verified, {req_failed} failed, {pending} pending "
-        f"(total {total_reqs})"
+        f"(total {total_reqs})\n"
+        "\n"
     )
-    lines.append("")
 
     # Requirements table
-    lines.append("## Requirements Status")
-    lines.append("")
-    lines.append("| Requirement | Status | Tests |")
-    lines.append("| --- | --- | --- |")
+    buf.write("## Requirements Status\n\n| Requirement | Status | Tests |\n| --- | --- | --- |\n")
     # Determine the full set of requirement IDs from SRVP document + tests mapping
     # Use precomputed comprehensive list
     all_req_ids = all_req_ids_sorted
@@ -288,26 +473,23 @@ def build_markdown_report(
     for req_id in all_req_ids:
         status = req_statuses.get(req_id, "[ ] Not Started")
         tests = ", ".join(req_to_tests.get(req_id, []))
-        lines.append(f"| {req_id} | {status} | {tests} |")
-    lines.append("")
+        buf.write(f"| {req_id} | {status} | {tests} |\n")
+    buf.write("\n")
 
     # Detailed section
-    lines.append("## Details")
-    lines.append("")
+    buf.write("## Details\n")
     for req_id in all_req_ids:
-        lines.append(f"### {req_id}")
-        lines.append("")
-        lines.append(f"- Status: {req_statuses.get(req_id, '[ ] Not Started')}")
-        lines.append("- Tests:")
-        for nodeid in req_to_tests.get(req_id, []):
+        status = req_statuses.get(req_id, "[ ] Not Started")
+        nodeids = req_to_tests.get(req_id, [])
+        buf.write(f"\n### {req_id}\n\n- Status: {status}\n- Tests:\n")
+        for nodeid in nodeids:
             outcome = test_outcomes.get(nodeid, "skipped")
-            badge = "✅" if outcome == "passed" else ("❌" if outcome == "failed" else "➖")
-            lines.append(f"  - {badge} `{nodeid}` — {outcome}")
-        if not req_to_tests.get(req_id):
-            lines.append("  - ➖ No tests mapped yet")
-        lines.append("")
+            badge = _BADGE.get(outcome, "➖")
+            buf.write(f"  - {badge} `{nodeid}` — {outcome}\n")
+        if not nodeids:
+            buf.write("  - ➖ No tests mapped yet\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def write_markdown_report(
@@ -0,0 +1,41 @@
+import importlib.util
+import subprocess
+from pathlib import Path
+
+import pytest
+
+HOOK_PATH = Path(__file__).parent.parent / "hooks" / "create_git_tag_from_changelog.py"
+
+
+@pytest.fixture
+def tag_hook():
+    spec = importlib.util.spec_from_file_location("create_git_tag_from_changelog", HOOK_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def git(tmp_path, monkeypatch):
+    """Return a git runner bound to a scratch repository used as the working directory."""
+
+    def run(*args):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    run("init", "-q")
+    run("-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-q",
+        "--allow-empty", "-m", "init")  # fmt: skip
+    monkeypatch.chdir(tmp_path)
+    return run
+
+
+def test_check_if_tag_exists(tag_hook, git):
+    """Tests exact tag lookups, including a branch that shares the tag's name."""
+    git("tag", "v1.0.0")
+    git("branch", "v1.0.0")
+    git("tag", "v1.1.0")
+
+    assert tag_hook.check_if_tag_exists("v1.0.0")
+    assert tag_hook.check_if_tag_exists("v1.1.0")
+    assert not tag_hook.check_if_tag_exists("v1.0")
+    assert not tag_hook.check_if_tag_exists("v2.0.0")
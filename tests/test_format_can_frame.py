@@ -0,0 +1,12 @@
+from core.utils import format_can_frame
+
+
+def test_format_can_frame(sample_frame):
+    """Tests that the payload is rendered as space-separated uppercase hex bytes."""
+    assert format_can_frame(sample_frame) == "ID=0x100 DATA=01 02 03"
+
+
+def test_format_can_frame_int_list_and_empty():
+    """Tests list-of-int payloads and frames without data."""
+    assert format_can_frame({"id": 0x1A, "data": [0xDE, 0xAD]}) == "ID=0x1A DATA=DE AD"
+    assert format_can_frame({"id": 0x7FF}) == "ID=0x7FF DATA="
@@ -6,3 +6,16 @@ def test_version_format():
     assert isinstance(v, str)
     assert v
     assert v.count(".") >= 1
+
+
+def test_version_falls_back_when_resources_unavailable(monkeypatch):
+    """Tests that a failing resources lookup yields "0.0.0" instead of an import error."""
+    from core import version
+
+    def boom(_package):
+        raise ModuleNotFoundError("core")
+
+    monkeypatch.setattr(version.resources, "files", boom)
+    assert version._resolve_version_file() is None
+    monkeypatch.setattr(version, "VERSION_FILE_PATH", None)
+    assert version._load_version() == "0.0.0"
@@ -0,0 +1,186 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).parent.parent / "scripts" / "update_srvp.py"
+
+SAMPLE_TESTS = '''
+def test_nodoc():
+    pass
+
+
+def test_plain():
+    """Covers REQ-FUNC-LOG-010."""
+
+
+async def test_async():
+    """Covers REQ-NFR-REL-001."""
+
+
+class TestGroup:
+    def test_method(self):
+        """Covers REQ-FUNC-LOG-010 and REQ-FUNC-CAN-002."""
+
+    def helper(self):
+        """REQ-FUNC-HLP-999 is not a test."""
+'''
+
+
+@pytest.fixture
+def srvp(tmp_path, monkeypatch):
+    """Load scripts/update_srvp.py with its test and cache paths under tmp_path."""
+    spec = importlib.util.spec_from_file_location("update_srvp", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    # Importable by name so ProcessPoolExecutor workers can unpickle its functions
+    monkeypatch.syspath_prepend(str(SCRIPT_PATH.parent))
+    monkeypatch.setitem(sys.modules, "update_srvp", module)
+    tests_dir = tmp_path / "tests"
+    tests_dir.mkdir()
+    monkeypatch.setattr(module, "TESTS_DIR", tests_dir)
+    monkeypatch.setattr(module, "REQMAP_CACHE_PATH", tmp_path / ".cache" / "srvp_reqmap.json")
+    monkeypatch.delenv("SRVP_NO_CACHE", raising=False)
+    monkeypatch.setenv("SRVP_JOBS", "1")
+    return module
+
+
+def test_extract_req_ids_from_docstrings(srvp):
+    """Tests class methods, async tests, docstring-less tests and unparsable files."""
+    (srvp.TESTS_DIR / "test_sample.py").write_text(SAMPLE_TESTS, encoding="utf-8")
+    (srvp.TESTS_DIR / "test_broken.py").write_text(
+        'def test_broken(:\n    """REQ-FUNC-BRK-001"""\n', encoding="utf-8"
+    )
+
+    assert srvp.extract_req_ids_from_docstrings() == {
+        "REQ-FUNC-LOG-010": [
+            "tests/test_sample.py::test_plain",
+            "tests/test_sample.py::TestGroup::test_method",
+        ],
+        "REQ-NFR-REL-001": ["tests/test_sample.py::test_async"],
+        "REQ-FUNC-CAN-002": ["tests/test_sample.py::TestGroup::test_method"],
+    }
+
+
+def test_extract_req_ids_uses_mtime_cache(srvp, monkeypatch):
+    """Tests cache miss, cache hit, and re-parse after a test file changes."""
+    test_file = srvp.TESTS_DIR / "test_cached.py"
+    test_file.write_text('def test_one():\n    """REQ-FUNC-LOG-010"""\n', encoding="utf-8")
+
+    scanned = []
+    scan = srvp._scan_test_file
+
+    def tracking_scan(path):
+        scanned.append(path.name)
+        return scan(path)
+
+    monkeypatch.setattr(srvp, "_scan_test_file", tracking_scan)
+
+    expected = {"REQ-FUNC-LOG-010": ["tests/test_cached.py::test_one"]}
+    assert srvp.extract_req_ids_from_docstrings() == expected
+    assert scanned == ["test_cached.py"]
+    assert srvp.REQMAP_CACHE_PATH.exists()
+
+    assert srvp.extract_req_ids_from_docstrings() == expected
+    assert scanned == ["test_cached.py"]
+
+    test_file.write_text('def test_one():\n    """REQ-NFR-REL-001 changed"""\n', encoding="utf-8")
+    assert srvp.extract_req_ids_from_docstrings() == {
+        "REQ-NFR-REL-001": ["tests/test_cached.py::test_one"]
+    }
+    assert scanned == ["test_cached.py", "test_cached.py"]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "[]",
+        "not json",
+        '{"files": {}}',
+        '{"version": 1, "files": []}',
+        '{"version": 1, "files": {"x": 1}}',
+        '{"version": 1, "files": {"x": {"mtime_ns": 1, "size": 2}}}',
+    ],
+)
+def test_load_reqmap_cache_rejects_malformed_content(srvp, content):
+    """Tests that unreadable, outdated or malformed cache files are ignored."""
+    srvp.REQMAP_CACHE_PATH.parent.mkdir(parents=True)
+    srvp.REQMAP_CACHE_PATH.write_text(content, encoding="utf-8")
+    assert srvp._load_reqmap_cache() == {}
+
+
+def test_extract_req_ids_parallel_matches_serial(srvp, monkeypatch, capsys):
+    """Tests that the process pool path yields the same mapping and ordered log output."""
+    for i in range(3):
+        (srvp.TESTS_DIR / f"test_mod{i}.py").write_text(
+            f'def test_{i}():\n    """REQ-FUNC-PAR-00{i}"""\n', encoding="utf-8"
+        )
+    monkeypatch.setenv("SRVP_NO_CACHE", "1")
+    serial = srvp.extract_req_ids_from_docstrings()
+    serial_out = capsys.readouterr().out
+
+    monkeypatch.setenv("SRVP_JOBS", "2")
+    monkeypatch.setattr(srvp, "PARALLEL_SCAN_MIN_FILES", 2)
+    monkeypatch.setattr(srvp, "_fork_start_method", lambda: True)
+    assert srvp.extract_req_ids_from_docstrings() == serial
+    assert capsys.readouterr().out == serial_out
+    assert "  Processing test_mod0.py...\n    REQ-FUNC-PAR-000 -> test_0\n" in serial_out
+
+
+REPORT_JSON = """{
+  "summary": {"total": 3},
+  "tests": [
+    {"nodeid": "tests/test_a.py::test_ok", "outcome": "passed", "call": {"duration": 0.1}},
+    {"nodeid": "tests/test_a.py::test_bad", "outcome": "failed", "keywords": ["x"]},
+    {"nodeid": "tests/test_b.py::TestC::test_skip", "outcome": "skipped"}
+  ]
+}"""
+
+EXPECTED_OUTCOMES = {
+    "tests/test_a.py::test_ok": "passed",
+    "tests/test_a.py::test_bad": "failed",
+    "tests/test_b.py::TestC::test_skip": "skipped",
+}
+
+
+@pytest.fixture
+def report_path(srvp, tmp_path, monkeypatch):
+    path = tmp_path / "report.json"
+    path.write_text(REPORT_JSON, encoding="utf-8")
+    monkeypatch.setattr(srvp, "REPORT_PATH", path)
+    return path
+
+
+def test_parse_test_report_with_ijson(srvp, report_path):
+    """Tests the streaming ijson branch of parse_test_report."""
+    pytest.importorskip("ijson")
+    assert srvp.parse_test_report() == EXPECTED_OUTCOMES
+
+
+def test_parse_test_report_without_ijson(srvp, report_path, monkeypatch):
+    """Tests the json.load fallback used when ijson is not installed."""
+    monkeypatch.setitem(sys.modules, "ijson", None)
+    assert srvp.parse_test_report() == EXPECTED_OUTCOMES
+
+
+def test_extract_req_ids_scans_serially_without_fork(srvp, monkeypatch):
+    """Tests that no process pool is started when workers would be spawned."""
+    for i in range(3):
+        (srvp.TESTS_DIR / f"test_mod{i}.py").write_text(
+            f'def test_{i}():\n    """REQ-FUNC-PAR-00{i}"""\n', encoding="utf-8"
+        )
+    monkeypatch.setenv("SRVP_JOBS", "2")
+    monkeypatch.setattr(srvp, "PARALLEL_SCAN_MIN_FILES", 2)
+    monkeypatch.setattr(srvp, "_fork_start_method", lambda: False)
+
+    scanned = []
+    scan = srvp._scan_test_file
+
+    def tracking_scan(path):
+        scanned.append(path.name)
+        return scan(path)
+
+    monkeypatch.setattr(srvp, "_scan_test_file", tracking_scan)
+    srvp.extract_req_ids_from_docstrings()
+    assert scanned == ["test_mod0.py", "test_mod1.py", "test_mod2.py"]